@@ -5,7 +5,7 @@ This module:
 - Connects to a MySQL database
 - Runs basic data quality checks on fact tables
 - Extracts dimension, fact, and optional KPI views
-- Exports results to CSV and Parquet formats
+- Exports results to Parquet (and optionally CSV) formats
 
 Designed for analytics and portfolio use.
 """
@@ -13,15 +13,37 @@ Designed for analytics and portfolio use.
 
 # =============================================================================
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import os
-import pathlib
+from urllib.parse import quote
+import connectorx as cx
 import pandas as pd
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+import pymysql.cursors
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+from sqlalchemy import bindparam, create_engine, text
+from sqlalchemy.engine import Connection, Engine
 from dotenv import load_dotenv
 
+try:
+    import polars as pl  # Optional: faster CSV writer
+except ImportError:
+    pl = None
+
+try:
+    import MySQLdb.cursors  # Optional: mysqlclient, a C driver
+
+    MYSQL_DRIVER = "mysqldb"
+    SSCursor = MySQLdb.cursors.SSCursor
+except ImportError:
+    MYSQL_DRIVER = "pymysql"
+    SSCursor = pymysql.cursors.SSCursor
+
 # =============================================================================
 
 # -----------------------------
@@ -51,7 +73,13 @@ class DBConfig:
 
 def get_engine(cfg: DBConfig) -> Engine:
     """
-    Create and return a SQLAlchemy engine using MySQL and PyMySQL.
+    Create and return a SQLAlchemy engine using MySQL.
+
+    Uses the mysqlclient C driver when it is installed, since it decodes
+    rows much faster; falls back to pure-Python PyMySQL otherwise.
+
+    The engine is used for data quality checks, metadata lookups and,
+    with connectorx releases that cannot stream, the large fact tables.
 
     Args:
         cfg: DBConfig object with connection parameters
@@ -60,12 +88,51 @@ def get_engine(cfg: DBConfig) -> Engine:
         SQLAlchemy Engine instance
     """
 
-    url = f"mysql+pymysql://{cfg.user}:{cfg.password}@{cfg.host}:{cfg.port}/{cfg.db}"
+    url = (
+        f"mysql+{MYSQL_DRIVER}://{cfg.user}:{cfg.password}"
+        f"@{cfg.host}:{cfg.port}/{cfg.db}?charset=utf8mb4"
+    )
     return create_engine(url, pool_pre_ping=True)
 
 # =============================================================================
 
-def run_checks(engine: Engine) -> Dict[str, int]:
+def get_cx_conn_str(cfg: DBConfig) -> str:
+    """
+    Build a connectorx connection string for bulk extraction.
+
+    Args:
+        cfg: DBConfig object with connection parameters
+
+    Returns:
+        MySQL connection URI understood by connectorx
+    """
+
+    password = quote(cfg.password, safe="")
+    return f"mysql://{cfg.user}:{password}@{cfg.host}:{cfg.port}/{cfg.db}"
+
+# =============================================================================
+
+def get_output_fs(output_dir: str) -> Tuple[pafs.FileSystem, str]:
+    """
+    Resolve the output directory to a filesystem and a path on it.
+
+    Local paths are made absolute; URIs such as s3://bucket/prefix resolve
+    to the matching pyarrow filesystem (e.g. S3FileSystem).
+
+    Args:
+        output_dir: Local path or filesystem URI
+
+    Returns:
+        Tuple of (filesystem, output directory path on that filesystem)
+    """
+
+    if "://" in output_dir:
+        return pafs.FileSystem.from_uri(output_dir)
+    return pafs.LocalFileSystem(), os.path.abspath(output_dir)
+
+# =============================================================================
+
+def run_checks(conn: Connection, explain: bool = False) -> Dict[str, int]:
     """
     Run basic data quality checks against fact tables.
 
@@ -75,137 +142,682 @@ def run_checks(engine: Engine) -> Dict[str, int]:
     - Negative monetary values
     - Invalid line item totals
 
+    Orphans are counted with NOT EXISTS in a WHERE clause, which MySQL
+    turns into an anti-join on the fact_order(order_id) primary key. Inside
+    an aggregate in the select list it would run as a dependent subquery
+    instead, so this check is kept out of the line-total scan and
+    fact_order_item is read twice (the orphan pass can use the order_id
+    index alone).
+
     Args:
-        engine: SQLAlchemy engine
+        conn: Open SQLAlchemy connection
+        explain: Print the MySQL query plan before running the checks
 
     Returns:
         Dictionary mapping check name to row count
     """
 
-    checks = {
-        "bad_total_rows": """
-            SELECT COUNT(*) AS n
+    # Checks on the same table share one scan (conditional aggregation),
+    # except the orphan anti-join, and everything runs in a single statement
+    # (single round-trip)
+    sql = """
+        SELECT
+            o.bad_total_rows,
+            a.orphan_items,
+            o.negative_money_rows,
+            i.bad_line_total_rows
+        FROM (
+            SELECT
+                COALESCE(SUM(
+                    ABS(total - (subtotal + tax + shipping)) > 0.02
+                ), 0) AS bad_total_rows,
+                COALESCE(SUM(
+                    subtotal < 0 OR tax < 0 OR shipping < 0 OR total < 0
+                ), 0) AS negative_money_rows
             FROM fact_order
-            WHERE ABS(total - (subtotal + tax + shipping)) > 0.02
-        """,
-        "orphan_items": """
-            SELECT COUNT(*) AS n
+        ) o
+        CROSS JOIN (
+            SELECT COUNT(*) AS orphan_items
             FROM fact_order_item oi
-            LEFT JOIN fact_order o ON o.order_id = oi.order_id
-            WHERE o.order_id IS NULL
-        """,
-        "negative_money_rows": """
-            SELECT COUNT(*) AS n
-            FROM fact_order
-            WHERE subtotal < 0 OR tax < 0 OR shipping < 0 OR total < 0
-        """,
-        "bad_line_total_rows": """
-            SELECT COUNT(*) AS n
-            FROM fact_order_item
-            WHERE ABS(line_total - (qty * unit_price)) > 0.02
-        """,
-    }
+            WHERE NOT EXISTS (
+                SELECT 1 FROM fact_order fo WHERE fo.order_id = oi.order_id
+            )
+        ) a
+        CROSS JOIN (
+            SELECT
+                COALESCE(SUM(
+                    ABS(oi.line_total - (oi.qty * oi.unit_price)) > 0.02
+                ), 0) AS bad_line_total_rows
+            FROM fact_order_item oi
+        ) i
+    """
 
-    # Execute each check and store scalar results
-    results: Dict[str, int] = {}
-    with engine.connect() as conn:
-        for name, q in checks.items():
-            results[name] = int(conn.execute(text(q)).scalar() or 0)
-    return results
+    if explain:
+        for plan_row in conn.execute(text(f"EXPLAIN {sql}")).mappings():
+            print("EXPLAIN:", dict(plan_row))
+    # Sent straight to the driver, skipping SQLAlchemy's result processing
+    result = conn.exec_driver_sql(sql)
+    row = result.fetchone()
+    return {
+        name: int(row[i]) if row and row[i] is not None else 0
+        for i, name in enumerate(result.keys())
+    }
 
 # =============================================================================
 
-def view_exists(engine: Engine, name: str) -> bool:
+def existing_views(conn: Connection, names: List[str]) -> Set[str]:
     """
-    Check whether a database view exists in the current schema.
+    Return which of the given views exist in the current schema.
+
+    All names are resolved with a single information_schema query.
 
     Args:
-        engine: SQLAlchemy engine
-        name: View name
+        conn: Open SQLAlchemy connection
+        names: View names to look up
 
     Returns:
-        True if view exists, False otherwise
+        Set of view names that exist
     """
 
-    sql = """
-    SELECT COUNT(*)
+    sql = text("""
+    SELECT table_name
     FROM information_schema.views
-    WHERE table_schema = DATABASE() AND table_name = :name
+    WHERE table_schema = DATABASE() AND table_name IN :names
+    """).bindparams(bindparam("names", expanding=True))
+    return set(conn.execute(sql, {"names": names}).scalars().all())
+
+# =============================================================================
+
+# Base tables extracted on every run
+TABLES = [
+    "dim_date",
+    "dim_customer",
+    "dim_product",
+    "fact_order",
+    "fact_order_item",
+    "fact_login",
+]
+
+# Integer column types mapped to the narrowest Arrow type that holds their
+# full declared range, as (signed, unsigned)
+INTEGER_TYPES = {
+    "tinyint": (pa.int8(), pa.uint8()),
+    "smallint": (pa.int16(), pa.uint16()),
+    "mediumint": (pa.int32(), pa.uint32()),
+    "int": (pa.int32(), pa.uint32()),
+    "bigint": (pa.int64(), pa.uint64()),
+    "year": (pa.int16(), pa.int16()),
+}
+
+# CHAR/VARCHAR columns up to this declared length (codes, flags, statuses,
+# names of months/days) are dictionary-encoded; ENUM/SET always are
+DICTIONARY_MAX_LENGTH = 32
+
+# =============================================================================
+
+def arrow_type(
+    data_type: str,
+    column_type: str,
+    precision: Optional[int],
+    scale: Optional[int],
+    max_length: Optional[int],
+) -> pa.DataType:
     """
-    with engine.connect() as conn:
-        return int(conn.execute(text(sql), {"name": name}).scalar() or 0) > 0
-    
+    Map a MySQL column type (from information_schema) to an Arrow type.
+
+    Types are narrowed from the declared column type rather than from the
+    values, so the same column gets the same type in every chunk and in
+    every table it appears in (e.g. INT keys are int32 in dims and facts).
+
+    Args:
+        data_type: DATA_TYPE, e.g. "int" or "decimal"
+        column_type: COLUMN_TYPE, e.g. "int unsigned" or "decimal(10,2)"
+        precision: NUMERIC_PRECISION (for DECIMAL)
+        scale: NUMERIC_SCALE (for DECIMAL)
+        max_length: CHARACTER_MAXIMUM_LENGTH (for text types)
+
+    Returns:
+        Arrow data type used for the column in every output chunk
+    """
+
+    data_type = data_type.lower()
+    if data_type in INTEGER_TYPES:
+        signed, unsigned = INTEGER_TYPES[data_type]
+        return unsigned if "unsigned" in column_type.lower() else signed
+    short_text = data_type in ("char", "varchar") and (
+        (max_length or 0) <= DICTIONARY_MAX_LENGTH
+    )
+    if short_text or data_type in ("enum", "set"):
+        return pa.dictionary(pa.int32(), pa.string())
+    if data_type in ("decimal", "numeric"):
+        # DECIMAL allows up to 65 digits; decimal128 holds at most 38
+        decimal = pa.decimal128 if int(precision) <= 38 else pa.decimal256
+        return decimal(int(precision), int(scale or 0))
+    if data_type == "float":
+        return pa.float32()
+    if data_type in ("double", "real"):
+        return pa.float64()
+    if data_type == "date":
+        return pa.date32()
+    if data_type in ("datetime", "timestamp"):
+        return pa.timestamp("us")
+    if data_type == "time":
+        # Time of day: connectorx reads TIME as time64, and both CSV writers
+        # format it as HH:MM:SS.ffffff (Arrow durations are written as raw
+        # integers or rejected)
+        return pa.time64("us")
+    if data_type in (
+        "binary", "varbinary", "tinyblob", "blob", "mediumblob", "longblob", "bit"
+    ):
+        return pa.binary()
+    # char/varchar/text/enum/set/json and anything else come back as text
+    return pa.string()
+
 # =============================================================================
 
-def extract(engine: Engine) -> Dict[str, pd.DataFrame]:
+def table_fields(conn: Connection, tables: List[str]) -> Dict[str, List[pa.Field]]:
     """
-    Extract dimension, fact, and optional KPI views into DataFrames.
+    Return the columns to extract for each table or view, in ordinal order.
 
-    Views are included only if they exist in the database.
+    Columns and their types are read from information_schema in a single
+    query, so every chunk of a table is written with the same Arrow schema
+    regardless of the values it happens to contain. Every column is
+    extracted: pruning to the columns the Power BI model uses is deferred
+    until that column set is pinned down.
+
+    Args:
+        conn: Open SQLAlchemy connection
+        tables: Table or view names to look up
+
+    Returns:
+        Dictionary mapping table name to Arrow fields
+    """
+
+    sql = text("""
+    SELECT table_name, column_name, data_type, column_type,
+           numeric_precision, numeric_scale, character_maximum_length
+    FROM information_schema.columns
+    WHERE table_schema = DATABASE() AND table_name IN :tables
+    ORDER BY table_name, ordinal_position
+    """).bindparams(bindparam("tables", expanding=True))
+
+    fields: Dict[str, List[pa.Field]] = {name: [] for name in tables}
+    for row in conn.execute(sql, {"tables": tables}):
+        table_name, column_name, *column_info = row
+        dtype = arrow_type(*column_info)
+        fields[table_name].append(pa.field(column_name, dtype))
+    return fields
+
+# =============================================================================
+
+# Large fact tables are streamed in chunks instead of loaded in one pass
+STREAMED_TABLES = {"fact_order", "fact_order_item", "fact_login"}
+
+# Rows per Parquet row group
+ROW_GROUP_ROWS = 256_000
+
+# Rows fetched and written per chunk for streamed tables (one row group)
+CHUNK_ROWS = ROW_GROUP_ROWS
+
+# Upper bound on tables/views extracted concurrently
+MAX_WORKERS = 8
+
+# Parquet writer settings: zstd compresses better than the default snappy
+# at similar speed; dictionary encoding suits low-cardinality columns
+PARQUET_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+    "data_page_size": 1 << 20,
+}
+
+# Fact tables written as Hive-partitioned Parquet datasets, mapped to the
+# expression holding their order date_key (YYYYMMDD) and the join it needs
+PARTITIONED_TABLES = {
+    "fact_order": ("t.date_key", ""),
+    "fact_order_item": (
+        "o.date_key",
+        "LEFT JOIN fact_order o ON o.order_id = t.order_id",
+    ),
+}
+
+# Partition columns derived from the order date_key
+PARTITION_COLUMNS = ["order_year", "order_month"]
+
+# Rows per file within a partition
+PARTITION_FILE_ROWS = 8 * ROW_GROUP_ROWS
+
+# Rows buffered per partition before a row group is written; lower than
+# ROW_GROUP_ROWS to bound memory when many partitions are open at once
+PARTITION_GROUP_MIN_ROWS = ROW_GROUP_ROWS // 4
+
+# =============================================================================
+
+class PolarsCSVWriter:
+    """
+    Streaming CSV writer backed by polars' native (Rust) CSV encoder.
+
+    Mirrors the pyarrow.csv.CSVWriter interface used by extract_and_write:
+    the header is written with the first table only, and closing the
+    writer leaves the sink open for the caller to close.
+    """
+
+    def __init__(self, sink: pa.NativeFile) -> None:
+        self._f = sink
+        self._header = True
+
+    def write_table(self, table: pa.Table) -> None:
+        pl.from_arrow(table).write_csv(
+            self._f,
+            include_header=self._header,
+            # Microseconds are kept, matching pyarrow's CSV writer
+            datetime_format="%Y-%m-%d %H:%M:%S%.6f",
+            time_format="%H:%M:%S%.6f",
+        )
+        self._header = False
+
+    def close(self) -> None:
+        pass
+
+# =============================================================================
+
+def open_csv_writer(sink: pa.NativeFile, schema: pa.Schema):
+    """
+    Open a streaming CSV writer, preferring polars when it is installed.
+
+    Args:
+        sink: Output stream to write CSV into
+        schema: Arrow schema of the tables to be written
+
+    Returns:
+        Writer with write_table(table) and close() methods
+    """
+
+    # polars has no 256-bit decimals (DECIMAL wider than 38 digits)
+    wide_decimal = any(pa.types.is_decimal256(f.type) for f in schema)
+    if pl is not None and not wide_decimal:
+        return PolarsCSVWriter(sink)
+    return pacsv.CSVWriter(sink, schema)
+
+# =============================================================================
+
+def iter_cursor_chunks(
+    engine: Engine, q: str, schema: pa.Schema
+) -> Iterator[pa.Table]:
+    """
+    Yield a query result as Arrow table chunks read through an unbuffered
+    (server-side) cursor, CHUNK_ROWS at a time.
+
+    Fallback for connectorx releases without record batch streaming; every
+    cell passes through a Python object, so it is much slower.
+
+    Args:
+        engine: SQLAlchemy engine
+        q: SQL query to run
+        schema: Arrow schema of the query result
+
+    Yields:
+        Arrow table chunks of the query result
+    """
+
+    # Raw DB-API connection with an unbuffered cursor: rows stream from
+    # the server and skip SQLAlchemy's per-row result processing
+    raw = engine.raw_connection()
+    try:
+        cur = raw.cursor(SSCursor)
+        try:
+            cur.execute(q)
+            columns = [c[0] for c in cur.description]
+            # The drivers return TIME values as timedelta and Arrow has
+            # no duration -> time cast, so TIME columns are read as
+            # durations and their microseconds reinterpreted as time64
+            time_columns = [
+                i for i, f in enumerate(schema) if pa.types.is_time(f.type)
+            ]
+            read_schema = pa.schema([
+                pa.field(f.name, pa.duration("us")) if i in time_columns else f
+                for i, f in enumerate(schema)
+            ])
+            batch = cur.fetchmany(CHUNK_ROWS)
+            while True:
+                # The first chunk is yielded even when empty, so that
+                # empty tables still get output files with a header.
+                # Raw rows and the previous chunk are released before
+                # the next fetch, so only one copy of a chunk is alive.
+                chunk = pa.Table.from_pandas(
+                    pd.DataFrame.from_records(batch, columns=columns),
+                    schema=read_schema,
+                    preserve_index=False,
+                )
+                for i in time_columns:
+                    micros = chunk.column(i).cast(pa.int64())
+                    chunk = chunk.set_column(
+                        i, schema.field(i), micros.cast(schema.field(i).type)
+                    )
+                del batch
+                yield chunk
+                del chunk
+                batch = cur.fetchmany(CHUNK_ROWS)
+                if not batch:
+                    break
+        finally:
+            cur.close()
+    finally:
+        raw.close()
+
+# =============================================================================
+
+def iter_chunks(
+    engine: Engine, conn_str: str, name: str, q: str, schema: pa.Schema
+) -> Iterator[pa.Table]:
+    """
+    Yield the result of a table or view query as Arrow table chunks.
+
+    Rows are decoded natively by connectorx rather than built up as Python
+    objects per cell. Streamed tables are read as a stream of record
+    batches, CHUNK_ROWS at a time; smaller tables and views are loaded in
+    one pass. Every chunk is converted to the given schema, which comes
+    from database metadata rather than from the values themselves.
+
+    Args:
+        engine: SQLAlchemy engine (fallback reader for streamed tables)
+        conn_str: connectorx connection string
+        name: Table or view name
+        q: SQL query to run
+        schema: Arrow schema of the query result
+
+    Yields:
+        Arrow table chunks of the query result (at least one, possibly empty)
+    """
+
+    if name not in STREAMED_TABLES:
+        yield cx.read_sql(conn_str, q, return_type="arrow").cast(schema)
+        return
+
+    try:
+        reader = cx.read_sql(
+            conn_str, q, return_type="arrow_stream", batch_size=CHUNK_ROWS
+        )
+    except ValueError:
+        # Older connectorx releases have no "arrow_stream" return type
+        yield from iter_cursor_chunks(engine, q, schema)
+        return
+
+    empty = True
+    for batch in reader:
+        chunk = pa.Table.from_batches([batch]).cast(schema)
+        del batch
+        empty = False
+        yield chunk
+        del chunk
+    if empty:
+        # Empty tables still get output files with a header
+        yield schema.empty_table()
+
+# =============================================================================
+
+def write_partitions(
+    reader: pa.RecordBatchReader, fs: pafs.FileSystem, base_dir: str
+) -> None:
+    """
+    Write a table's record batches to a Hive-partitioned Parquet dataset.
+
+    Rows are split by PARTITION_COLUMNS into order_year=YYYY/order_month=M
+    directories, so readers filtering on dates can skip whole partitions.
+    The whole table goes through a single dataset writer, which buffers
+    rows per partition into full row groups, so each partition gets one
+    file per PARTITION_FILE_ROWS rows however the input is ordered.
+
+    Args:
+        reader: Record batches of the table
+        fs: Output filesystem
+        base_dir: Dataset root directory on fs
+    """
+
+    ds.write_dataset(
+        reader,
+        base_dir=base_dir,
+        filesystem=fs,
+        format="parquet",
+        partitioning=PARTITION_COLUMNS,
+        partitioning_flavor="hive",
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        file_options=ds.ParquetFileFormat().make_write_options(**PARQUET_OPTIONS),
+        max_rows_per_file=PARTITION_FILE_ROWS,
+        min_rows_per_group=PARTITION_GROUP_MIN_ROWS,
+        max_rows_per_group=ROW_GROUP_ROWS,
+    )
+
+# =============================================================================
+
+def extract_and_write(
+    engine: Engine,
+    conn_str: str,
+    name: str,
+    q: str,
+    schema: pa.Schema,
+    fs: pafs.FileSystem,
+    out_dir: str,
+    emit_csv: bool = False,
+) -> int:
+    """
+    Extract a single table or view and write it to Parquet (and CSV).
+
+    Chunks are appended to the output files as they arrive. Writes run on
+    background threads, so fetching the next chunk overlaps writing the
+    previous one; at most one chunk is waiting to be written at a time.
+    Tables listed in PARTITIONED_TABLES are instead fed, batch by batch,
+    to one dataset writer that fills a partitioned dataset directory.
 
     Args:
         engine: SQLAlchemy engine
+        conn_str: connectorx connection string
+        name: Table or view name (used for output file names)
+        q: SQL query to run
+        schema: Arrow schema of the query result (from database metadata)
+        fs: Output filesystem (local or remote, e.g. S3)
+        out_dir: Output directory path on fs
+        emit_csv: Also write a CSV copy of the table
 
     Returns:
-        Dictionary mapping table or view name to pandas DataFrame
+        Number of rows written
     """
 
-    queries = {
-        "dim_date": "SELECT * FROM dim_date",
-        "dim_customer": "SELECT * FROM dim_customer",
-        "dim_product": "SELECT * FROM dim_product",
-        "fact_order": "SELECT * FROM fact_order",
-        "fact_order_item": "SELECT * FROM fact_order_item",
-        "fact_login": "SELECT * FROM fact_login",
-    }
+    csv_path = f"{out_dir}/{name}.csv"
+    parquet_path = f"{out_dir}/parquet/{name}.parquet"
+    dataset_dir = f"{out_dir}/parquet/{name}"
+    partitioned = name in PARTITIONED_TABLES
+    if partitioned:
+        # Clear out the previous run's files first; the directory exists
+        # even when the table has no rows
+        fs.delete_dir_contents(dataset_dir, missing_dir_ok=True)
+        fs.create_dir(dataset_dir, recursive=True)
+        # Drop the single-file output of runs before the partitioned layout,
+        # so nothing keeps reading stale data from it
+        if fs.get_file_info(parquet_path).type != pafs.FileType.NotFound:
+            fs.delete_file(parquet_path)
+    if not emit_csv:
+        # Likewise drop the CSV of an earlier EMIT_CSV=1 run
+        if fs.get_file_info(csv_path).type != pafs.FileType.NotFound:
+            fs.delete_file(csv_path)
+
+    writer = None
+    csv_sink = None
+    csv_writer = None
+    rows = 0
+    try:
+        # Writers are opened up front from the metadata schema, so empty
+        # tables still get typed output files
+        if not partitioned:
+            writer = pq.ParquetWriter(
+                parquet_path, schema, filesystem=fs, **PARQUET_OPTIONS
+            )
+        if emit_csv:
+            csv_sink = fs.open_output_stream(csv_path)
+            csv_writer = open_csv_writer(csv_sink, schema)
+
+        with ThreadPoolExecutor(max_workers=2) as write_pool:
+            csv_job = None
+
+            def tables() -> Iterator[pa.Table]:
+                # Each chunk is also queued for the CSV writer; one CSV job
+                # is in flight at a time, which keeps the file in order
+                nonlocal rows, csv_job
+                for table in iter_chunks(engine, conn_str, name, q, schema):
+                    if csv_writer is not None:
+                        if csv_job is not None:
+                            csv_job.result()
+                        csv_job = write_pool.submit(csv_writer.write_table, table)
+                    rows += table.num_rows
+                    yield table
+
+            if partitioned:
+                # A single dataset writer pulls the whole table, so it decides
+                # the files and row groups of every partition
+                batches = (b for table in tables() for b in table.to_batches())
+                reader = pa.RecordBatchReader.from_batches(schema, batches)
+                job = write_pool.submit(write_partitions, reader, fs, dataset_dir)
+                job.result()
+            else:
+                parquet_job = None
+                for table in tables():
+                    if parquet_job is not None:
+                        parquet_job.result()
+                    parquet_job = write_pool.submit(
+                        writer.write_table, table, row_group_size=ROW_GROUP_ROWS
+                    )
+                    del table
+                if parquet_job is not None:
+                    parquet_job.result()
+
+            if csv_job is not None:
+                csv_job.result()
+    finally:
+        if writer is not None:
+            writer.close()
+        if csv_writer is not None:
+            csv_writer.close()
+        if csv_sink is not None:
+            csv_sink.close()
+    return rows
+
+# =============================================================================
+
+def build_queries(
+    conn: Connection,
+) -> Tuple[Dict[str, str], Dict[str, pa.Schema]]:
+    """
+    Build the extract query and output schema for each dimension, fact,
+    and optional KPI view.
+
+    Views are included only if they exist in the database.
+
+    Args:
+        conn: Open SQLAlchemy connection
+
+    Returns:
+        Tuple of dictionaries mapping table or view name to SQL query and
+        to Arrow schema
+    """
+
+    present = existing_views(
+        conn, ["vw_monthly_kpis", "vw_monthly_mau", "vw_customer_metrics"]
+    )
+    fields = table_fields(conn, TABLES + sorted(present))
+
+    # Base tables, with an explicit column list from the metadata
+    queries = {}
+    for name in TABLES:
+        select_list = ", ".join(f"t.`{f.name}`" for f in fields[name]) or "t.*"
+        join = ""
+        if name in PARTITIONED_TABLES:
+            date_key, join = PARTITIONED_TABLES[name]
+            select_list += (
+                f", {date_key} DIV 10000 AS order_year"
+                f", {date_key} DIV 100 MOD 100 AS order_month"
+            )
+            fields[name] += [
+                pa.field("order_year", pa.int16()),
+                pa.field("order_month", pa.int8()),
+            ]
+        queries[name] = f"SELECT {select_list} FROM {name} t {join}".strip()
 
     # Optional analytics views
-    if view_exists(engine, "vw_monthly_kpis"):
+    if "vw_monthly_kpis" in present:
         queries["vw_monthly_kpis"] = """
             SELECT *
             FROM vw_monthly_kpis
             ORDER BY order_year, order_month
         """
 
-    if view_exists(engine, "vw_monthly_mau"):
+    if "vw_monthly_mau" in present:
         queries["vw_monthly_mau"] = """
             SELECT *
             FROM vw_monthly_mau
             ORDER BY login_year, login_month
         """
 
-    if view_exists(engine, "vw_customer_metrics"):
+    if "vw_customer_metrics" in present:
         queries["vw_customer_metrics"] = """
             SELECT *
             FROM vw_customer_metrics
             ORDER BY lifetime_value_completed DESC
         """
 
-    # Execute queries and load into DataFrames
-    dfs: Dict[str, pd.DataFrame] = {}
-    for name, q in queries.items():
-        dfs[name] = pd.read_sql(q, engine)
-    return dfs
+    schemas = {name: pa.schema(fields[name]) for name in queries}
+    return queries, schemas
 
 # =============================================================================
 
-def write_outputs(dfs: Dict[str, pd.DataFrame], out_dir: str) -> None:
+def extract(
+    engine: Engine,
+    conn_str: str,
+    queries: Dict[str, str],
+    schemas: Dict[str, pa.Schema],
+    fs: pafs.FileSystem,
+    out_dir: str,
+    emit_csv: bool = False,
+) -> Dict[str, int]:
     """
-    Write extracted DataFrames to CSV and Parquet files.
+    Extract tables and views to Parquet (and CSV).
+
+    Tables are independent, so they are extracted and written concurrently.
+    Each worker takes its own pooled connection, since a connection cannot
+    be shared across threads.
 
     Args:
-        dfs: Dictionary of DataFrames
-        out_dir: Output directory path
-    """
-    os.makedirs(out_dir, exist_ok=True)
+        engine: SQLAlchemy engine
+        conn_str: connectorx connection string
+        queries: Dictionary mapping table or view name to SQL query
+        schemas: Dictionary mapping table or view name to Arrow schema
+        fs: Output filesystem (local or remote, e.g. S3)
+        out_dir: Output directory path on fs
+        emit_csv: Also write a CSV copy of each table
 
-    for name, df in dfs.items():
-        df.to_csv(os.path.join(out_dir, f"{name}.csv"), index=False)
+    Returns:
+        Dictionary mapping table or view name to rows written
+    """
 
-    parquet_dir = os.path.join(out_dir, "parquet")
-    os.makedirs(parquet_dir, exist_ok=True)
-    for name, df in dfs.items():
-        df.to_parquet(os.path.join(parquet_dir, f"{name}.parquet"), index=False)
+    fs.create_dir(f"{out_dir}/parquet", recursive=True)
+
+    # Extract and write each table concurrently
+    with ThreadPoolExecutor(max_workers=min(len(queries), MAX_WORKERS)) as ex:
+        futures = {
+            name: ex.submit(
+                extract_and_write,
+                engine,
+                conn_str,
+                name,
+                q,
+                schemas[name],
+                fs,
+                out_dir,
+                emit_csv,
+            )
+            for name, q in queries.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
 
 # =============================================================================
 
@@ -216,8 +828,7 @@ def main() -> None:
     - Validates output directory access
     - Creates database engine
     - Runs data quality checks
-    - Extracts data
-    - Writes outputs to disk
+    - Extracts data and streams it to output files
     """
 
     load_dotenv() # Load .env from the current working directory (project root)
@@ -231,51 +842,78 @@ def main() -> None:
         db=os.getenv("DB_NAME", "ops_portfolio"),
     )
 
-    print(">>> CONFIG <<<")
-    print("Host: ", cfg.host)
-    print("Port: ", cfg.port)
-    print("User: ",cfg.user)
-    print("DB: ",cfg.db)
+    # Status lines are collected per phase and printed in one write
+    print("\n".join([
+        ">>> CONFIG <<<",
+        f"Host:  {cfg.host}",
+        f"Port:  {cfg.port}",
+        f"User:  {cfg.user}",
+        f"DB:  {cfg.db}",
+    ]))
 
     # Fail fast if password is missing
     if not cfg.password:
         raise ValueError("DB_PASSWORD is empty. Check your .env file.")
 
-    # Resolve output directory
+    # Resolve output directory and formats (CSV is opt-in)
     output_dir = os.getenv("OUTPUT_DIR", "./output")
+    emit_csv = os.getenv("EMIT_CSV", "0") == "1"
+    explain_checks = os.getenv("ETL_EXPLAIN", "0") == "1"
 
-    print("CWD:", os.getcwd())
-    print("OUTPUT_DIR:", output_dir)
+    print("\n".join([
+        f"CWD: {os.getcwd()}",
+        f"OUTPUT_DIR: {output_dir}",
+        f"EMIT_CSV: {emit_csv}",
+    ]))
 
-    abs_out = os.path.abspath(output_dir)
-    pathlib.Path(abs_out).mkdir(parents=True, exist_ok=True)
+    fs, abs_out = get_output_fs(output_dir)
+    fs.create_dir(abs_out, recursive=True)
 
     # Test write permissions
-    test_path = os.path.join(abs_out, "_write_test.txt")
-    with open(test_path, "w", encoding="utf-8") as f:
-        f.write("ETL write test OK\n")
-
-    print(">>> WRITE TEST OK <<<", test_path)
+    test_path = f"{abs_out}/_write_test.txt"
+    with fs.open_output_stream(test_path) as f:
+        f.write(b"ETL write test OK\n")
 
     # Create DB engine
     engine = get_engine(cfg)
-    print(">>> ENGINE CREATED <<<")
-
-    # Run data quality checks
-    check_results = run_checks(engine)
-    print(">>> DATA QUALITY CHECKS <<<", check_results)
+    print("\n".join([
+        f">>> WRITE TEST OK <<< {test_path}",
+        ">>> ENGINE CREATED <<<",
+    ]))
 
-    # Extract tables and views
-    dfs = extract(engine)
-    print(">>> EXTRACTED TABLES <<<", list(dfs.keys()))
-
-    # Write output files
-    write_outputs(dfs, out_dir=abs_out)
-    print(">>> EXPORT COMPLETE <<<")
-
-    print("Files written to:", abs_out)
-    for k in sorted(dfs.keys()):
-        print(f"  - {k}.csv")
+    # Run data quality checks and metadata lookups on one connection
+    with engine.connect() as conn:
+        check_results = run_checks(conn, explain=explain_checks)
+        print(">>> DATA QUALITY CHECKS <<<", check_results)
+
+        queries, schemas = build_queries(conn)
+
+    # Extract tables and views, streaming them to output files
+    row_counts = extract(
+        engine,
+        get_cx_conn_str(cfg),
+        queries,
+        schemas,
+        fs=fs,
+        out_dir=abs_out,
+        emit_csv=emit_csv,
+    )
+    messages = [
+        f">>> EXTRACTED TABLES <<< {row_counts}",
+        ">>> EXPORT COMPLETE <<<",
+        f"Files written to: {abs_out}",
+    ]
+    for k in sorted(row_counts.keys()):
+        if k in PARTITIONED_TABLES:
+            messages.append(
+                f"  - parquet/{k}/ (partitioned by {', '.join(PARTITION_COLUMNS)}"
+                f", {row_counts[k]} rows)"
+            )
+        else:
+            messages.append(f"  - parquet/{k}.parquet")
+        if emit_csv:
+            messages.append(f"  - {k}.csv")
+    print("\n".join(messages))
 
 # =============================================================================
 